@@ -4,6 +4,11 @@ import sys
 import math
 import os
 import time
+import functools
+import hashlib
+import bisect
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Try importing numpy for sound synthesis
 try:
@@ -14,6 +19,13 @@ except ImportError:
     HAS_NUMPY = False
     print("WARNING: NumPy not found. Audio will be disabled.")
 
+# Try importing numba for JIT-compiled pixel kernels (optional speedup)
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # ==============================================================================
 # 1. CONFIGURATION
 # ==============================================================================
@@ -22,6 +34,7 @@ class Config:
     SCREEN_WIDTH = 960
     SCREEN_HEIGHT = 540
     FPS = 60
+    IDLE_FPS = 15 # Event poll rate on the static MENU / GAMEOVER screens
     TITLE = "Samurai Runner: The Unbeatable Path"
 
     # Physics
@@ -39,6 +52,20 @@ class Config:
     SCORE_PER_FRAME = 0.2
     NIGHT_CYCLE_FRAMES = 1200 # Frames until day/night switch
 
+    # Synthesized sound buffers are reused from here on later launches
+    SOUND_CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                    'samurai_runner', 'sounds.npz')
+
+    # Optional bundled fonts (impact.ttf, dejavusans-bold.ttf); system fonts are used when absent
+    FONT_DIR = os.path.join('assets', 'fonts')
+
+    # Collision: False = per-type hitboxes (AABB), True = pixel-perfect masks (slower)
+    PIXEL_PERFECT = False
+
+    # Debug
+    DEBUG_ASSETS = os.environ.get('SAMURAI_DEBUG_ASSETS') == '1' # Pixel-count diagnostics at load
+    DEBUG_SPAWN = os.environ.get('SAMURAI_DEBUG_SPAWN') == '1'   # Log dragon spawns
+
     # Colors
     COLORS = {
         'day_sky': (135, 206, 235),      # Sky Blue
@@ -53,6 +80,20 @@ class Config:
 # ==============================================================================
 # 2. AUDIO ENGINE (Procedural Sound Synthesis)
 # ==============================================================================
+@functools.lru_cache(maxsize=16)
+def _fade_envelope(n_samples):
+    # Linear 1 -> 0 fade shared by every sound of the same length (read-only)
+    env = np.linspace(1.0, 0.0, n_samples, dtype=np.float32)
+    env.flags.writeable = False
+    return env
+
+@functools.lru_cache(maxsize=16)
+def _fade_envelope_q15(n_samples):
+    # Same fade as fixed-point Q15 (0..32767) int32, for integer-only sample math
+    env = (_fade_envelope(n_samples) * 32767).astype(np.int32)
+    env.flags.writeable = False
+    return env
+
 class AudioManager:
     """
     Generates retro game sounds using NumPy so no external .wav files are needed.
@@ -64,15 +105,49 @@ class AudioManager:
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
             self.generate_sounds()
 
-    def generate_sounds(self):
-        """Pre-calculates sound waves"""
-        self.sounds['jump'] = self._make_tone(440, 0.1, shape='square', slide=100)
-        self.sounds['double_jump'] = self._make_tone(660, 0.1, shape='sine', slide=200)
-        self.sounds['slash'] = self._make_noise(0.15, fade_out=True)
-        self.sounds['hit'] = self._make_noise(0.3, pitch_drop=True)
+    # (name, synth method, args, kwargs); also hashed into the sound cache key
+    SOUND_SPECS = [
+        ('jump', '_make_tone', (440, 0.1), {'shape': 'square', 'slide': 100}),
+        ('double_jump', '_make_tone', (660, 0.1), {'shape': 'sine', 'slide': 200}),
+        ('slash', '_make_noise', (0.15,), {'fade_out': True}),
+        ('hit', '_make_noise', (0.3,), {'pitch_drop': True}),
         # Use a simple pleasant tone for powerup to avoid None
-        self.sounds['powerup'] = self._make_tone(554, 0.12, shape='sine', slide=120)
-        self.sounds['score'] = self._make_tone(880, 0.05, shape='sine')
+        ('powerup', '_make_tone', (554, 0.12), {'shape': 'sine', 'slide': 120}),
+        ('score', '_make_tone', (880, 0.05), {'shape': 'sine'}),
+    ]
+    # Bump when the synthesis code changes so stale cached buffers are ignored
+    SYNTH_VERSION = 1
+
+    def generate_sounds(self):
+        """Pre-calculates sound waves, reusing the on-disk cache when the specs match"""
+        key = hashlib.sha1(repr((self.SYNTH_VERSION, self.SOUND_SPECS)).encode()).hexdigest()
+        waves = self._load_cached_waves(key)
+        if waves is None:
+            waves = {name: getattr(self, synth)(*args, **kwargs) for name, synth, args, kwargs in self.SOUND_SPECS}
+            self._save_cached_waves(key, waves)
+        for name, wave in waves.items():
+            self.sounds[name] = pygame.sndarray.make_sound(wave)
+
+    def _load_cached_waves(self, key):
+        try:
+            with np.load(Config.SOUND_CACHE_PATH) as data:
+                if str(data['_key']) != key:
+                    return None
+                return {name: data[name] for name, _synth, _args, _kwargs in self.SOUND_SPECS}
+        except Exception:
+            return None
+
+    def _save_cached_waves(self, key, waves):
+        # Best effort: a read-only or missing cache dir just means synthesizing next time too
+        path = Config.SOUND_CACHE_PATH
+        tmp = path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, 'wb') as f:
+                np.savez(f, _key=np.array(key), **waves)
+            os.replace(tmp, path)
+        except Exception:
+            pass
 
     def play(self, name):
         snd = self.sounds.get(name)
@@ -85,37 +160,44 @@ class AudioManager:
     def _make_tone(self, freq, duration, vol=0.5, shape='sine', slide=0):
         sample_rate = 22050
         n_samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, n_samples, False)
-        
+        # Single float32 buffer: time -> phase -> waveform, all in place
+        phase = np.arange(n_samples, dtype=np.float32)
+        phase *= np.float32(2 * math.pi / sample_rate)
+
         # Frequency slide logic
         if slide != 0:
-            freq = np.linspace(freq, freq + slide, n_samples)
-        
-        if shape == 'sine':
-            waveform = np.sin(2 * np.pi * freq * t)
-        elif shape == 'square':
-            waveform = np.sign(np.sin(2 * np.pi * freq * t))
-        
-        # Envelope (Fade out)
-        envelope = np.linspace(1, 0, n_samples)
-        
-        # Stereo duplication and int16 conversion
-        audio_data = (waveform * envelope * vol * 32767).astype(np.int16)
-        audio_data = np.repeat(audio_data[:, np.newaxis], 2, axis=1)
-        return pygame.sndarray.make_sound(audio_data)
+            phase *= np.linspace(freq, freq + slide, n_samples, dtype=np.float32)
+        else:
+            phase *= np.float32(freq)
+
+        np.sin(phase, out=phase)
+        if shape == 'square':
+            np.sign(phase, out=phase)
+
+        # Envelope (Fade out) and volume scale
+        phase *= _fade_envelope(n_samples)
+        phase *= np.float32(vol * 32767)
+        return self._stereo(phase.astype(np.int16))
 
     def _make_noise(self, duration, vol=0.5, fade_out=True, pitch_drop=False):
         sample_rate = 22050
         n_samples = int(sample_rate * duration)
-        waveform = np.random.uniform(-1, 1, n_samples)
-        
+        # Full-scale int16 noise, scaled in Q15 fixed point (no float temporaries)
+        raw = np.random.default_rng().integers(-32767, 32767, n_samples, dtype=np.int16, endpoint=True)
+        samples = raw.astype(np.int32)
+
         if fade_out:
-            envelope = np.linspace(1, 0, n_samples)
-            waveform *= envelope
-            
-        audio_data = (waveform * vol * 32767).astype(np.int16)
-        audio_data = np.repeat(audio_data[:, np.newaxis], 2, axis=1)
-        return pygame.sndarray.make_sound(audio_data)
+            samples *= _fade_envelope_q15(n_samples)
+            samples >>= 15
+        # Separate shift keeps every product inside int32
+        samples *= int(vol * 32767)
+        samples >>= 15
+
+        return self._stereo(samples.astype(np.int16))
+
+    def _stereo(self, mono):
+        # Duplicate the mono int16 channel into a contiguous (n, 2) buffer
+        return np.ascontiguousarray(np.broadcast_to(mono[:, np.newaxis], (mono.shape[0], 2)))
 
     def _make_sequence(self, freqs, step_dur):
         # Combine multiple tones
@@ -124,17 +206,174 @@ class AudioManager:
 # ==============================================================================
 # 3. ASSET LOADER (Sprite Cutting)
 # ==============================================================================
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _luma_threshold(rgb, threshold, out_alpha):
+        # Integer luma scaled by 256 (weights sum to 256) -> opaque/transparent alpha plane
+        w, h = out_alpha.shape
+        limit = threshold * 256
+        for x in prange(w):
+            for y in range(h):
+                luma = 77 * rgb[x, y, 0] + 150 * rgb[x, y, 1] + 29 * rgb[x, y, 2]
+                out_alpha[x, y] = 255 if luma > limit else 0
+
+def _display_format(surf):
+    # Match the display pixel format once so per-frame blits skip conversion
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha()
+
+def _ticket_drawing(color):
+    return lambda s: [
+        pygame.draw.rect(s, color, (0,0,40,30), border_radius=6),
+        pygame.draw.rect(s, (255,255,255,60), (4,4,32,22), 2, border_radius=4)
+    ]
+
+# Static procedural sprites: name -> (width, height, draw_fn)
+PROCEDURAL_SPRITES = {
+    # Fallback simple silhouettes if any samurai frame is missing
+    'placeholder_samurai': (100, 120, lambda s: pygame.draw.rect(s, (50,50,50), (20, 20, 60, 80), border_radius=10)),
+    'placeholder_duck': (120, 80, lambda s: pygame.draw.rect(s, (50,50,50), (10,20,100,50), border_radius=8)),
+    # FX
+    'tornado': (120, 120, lambda s: [
+        pygame.draw.arc(s, (200,200,255), (0,0,120,120), 0.5, 2.5, 6),
+        pygame.draw.arc(s, (160,160,220), (10,10,100,100), 0.6, 2.6, 5)
+    ]),
+    # Blue dash flame
+    'dash_flame': (80, 80, lambda s: [
+        pygame.draw.circle(s, (100,180,255,180), (40,40), 28),
+        pygame.draw.circle(s, (150,220,255,160), (40,40), 18)
+    ]),
+    # Ticket powerups
+    'ticket_blue': (40, 30, _ticket_drawing((80,160,255))),
+    'ticket_yellow': (40, 30, _ticket_drawing((255,215,64))),
+    # Obstacles
+    'rock': (40, 40, lambda s: pygame.draw.circle(s, (130,130,130), (20,20), 18)),
+    'barrel': (70, 70, lambda s: [
+        pygame.draw.rect(s, (139,69,19), (5,5,60,60), border_radius=6),
+        pygame.draw.line(s, (90,50,10), (5,20), (65,20), 4),
+        pygame.draw.line(s, (90,50,10), (5,45), (65,45), 4)
+    ]),
+    'bamboo': (60, 140, lambda s: [
+        pygame.draw.rect(s, (40,160,60), (25,0,10,140)),
+        pygame.draw.line(s, (80,200,100), (25,20), (35,20), 3),
+        pygame.draw.line(s, (80,200,100), (25,60), (35,60), 3),
+        pygame.draw.line(s, (80,200,100), (25,100), (35,100), 3)
+    ]),
+    'boulder': (120, 120, lambda s: pygame.draw.circle(s, (110,110,110), (60,60), 56)),
+    # Dragon wing-flap frames when no Dragon.gif is provided
+    'dragon_base1': (110, 90, lambda s: pygame.draw.polygon(s, (180,180,180), [(10,70),(60,20),(100,50),(60,60)])),
+    'dragon_base2': (110, 90, lambda s: pygame.draw.polygon(s, (180,180,180), [(10,50),(60,10),(100,40),(60,70)])),
+    # Items
+    'talisman': (30, 40, lambda s: [
+        pygame.draw.rect(s, (255, 235, 120), (5,5,20,30), border_radius=4),
+        pygame.draw.line(s, (220, 160, 40), (10,12), (20,28), 3)
+    ]),
+    'scroll': (40, 40, lambda s: pygame.draw.rect(s, (220,220,220), (5,8,30,24), border_radius=4)),
+    # Env placeholders
+    'pagoda': (150, 120, lambda s: [
+        pygame.draw.rect(s, (60,60,80), (50,40,50,70)),
+        pygame.draw.polygon(s, (80,80,110), [(35,40),(75,10),(115,40)])
+    ]),
+    'lantern': (40, 60, lambda s: [
+        pygame.draw.ellipse(s, (255,140,0), (5,10,30,40)),
+        pygame.draw.circle(s, (255,220,120), (20,30), 6)
+    ]),
+}
+
+# Rendered PROCEDURAL_SPRITES, shared by every AssetLoader
+_procedural_cache = {}
+
+def procedural_sprite(name):
+    """Draws a PROCEDURAL_SPRITES entry once per process and returns the shared surface."""
+    surf = _procedural_cache.get(name)
+    if surf is None:
+        w, h, draw_fn = PROCEDURAL_SPRITES[name]
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        draw_fn(surf)
+        # Only keep display-format copies; an early render before set_mode is redone later
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+            _procedural_cache[name] = surf
+    return surf
+
+class LazySpriteDict(dict):
+    """
+    Sprite dict whose registered entries are only built on first access, so
+    sprites a run never draws (e.g. tornado, scroll) cost nothing at startup.
+    """
+    def __init__(self):
+        super().__init__()
+        self._factories = {}
+
+    def register(self, key, factory):
+        self._factories[key] = factory
+
+    def __missing__(self, key):
+        factory = self._factories.pop(key, None)
+        if factory is None:
+            raise KeyError(key)
+        value = self[key] = factory()
+        return value
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._factories
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 class AssetLoader:
+    # Fixed file names load_all asks for outside the directory-scan buckets
+    NAMED_FILES = ['Running_leftLeg.png', 'RIght_leg.png', 'Right_leg.png', 'Still_samurai.png',
+                   'Jump_samrai.png', 'Down_samrai.png', 'rock.png', 'drum.png', 'barrel.png',
+                   'bamboo.png', 'boulder.png']
+
     def __init__(self, images_dir='images'):
         self.sheet = None
-        self.sprites = {}
+        self.sprites = LazySpriteDict()
         self.images_dir = images_dir
+        # Decoded (not yet converted) images from _preload, keyed by file name
+        self._decoded = {}
+        # Converted results of _load_image_file, keyed by (file name, scale)
+        self._images = {}
         # We don't rely on a sprite sheet anymore; load individual files if they exist.
 
+    def _load_image_file_raw(self, filename):
+        # Decode only: convert_alpha needs the display and must run on the main thread
+        try:
+            return pygame.image.load(os.path.join(self.images_dir, filename))
+        except Exception:
+            return None
+
+    def _preload(self, filenames):
+        # File reads and PNG/JPEG decoding release the GIL, so overlap them on a small pool
+        names = [f for f in dict.fromkeys(filenames) if f not in self._decoded]
+        if not names:
+            return
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            for fname, img in zip(names, ex.map(self._load_image_file_raw, names)):
+                self._decoded[fname] = img
+
     def _load_image_file(self, filename, scale=1.0):
+        # Several scan buckets can match one file (e.g. 'drum' and 'obstacle'); convert it once
+        key = (filename, scale)
+        if key not in self._images:
+            self._images[key] = self._convert_image_file(filename, scale)
+        return self._images[key]
+
+    def _convert_image_file(self, filename, scale):
         path = os.path.join(self.images_dir, filename)
         try:
-            img = pygame.image.load(path).convert_alpha()
+            if filename in self._decoded:
+                img = self._decoded[filename]
+                if img is None:
+                    return None
+                img = img.convert_alpha()
+            else:
+                img = pygame.image.load(path).convert_alpha()
             if scale != 1.0:
                 w, h = img.get_width(), img.get_height()
                 img = pygame.transform.scale(img, (int(w*scale), int(h*scale)))
@@ -142,13 +381,41 @@ class AssetLoader:
         except Exception:
             return None
 
-    def _make_surface(self, w, h, draw_fn=None):
-        surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        if draw_fn:
-            draw_fn(surf)
-        return surf
+    def _scan_images_dir(self):
+        # One directory pass; each section of load_all reads its own bucket
+        buckets = {key: [] for key in ('ticket', 'drum', 'rock', 'bamboo', 'day', 'night', 'obstacle', 'dragon_gif')}
+        try:
+            names = os.listdir(self.images_dir)
+        except Exception:
+            return buckets
+        for fname in names:
+            low = fname.lower()
+            is_image = any(ext in low for ext in ['.png', '.jpg', '.jpeg'])
+            if 'ticket' in low and is_image:
+                buckets['ticket'].append(fname)
+            if ('drum' in low) or ('barrel' in low) or ('dum' in low):
+                buckets['drum'].append(fname)
+            if ('rock' in low) or ('stone' in low):
+                buckets['rock'].append(fname)
+            if 'bamboo' in low:
+                buckets['bamboo'].append(fname)
+            if 'day' in low and is_image:
+                buckets['day'].append(fname)
+            if 'night' in low and is_image:
+                buckets['night'].append(fname)
+            if any(key in low for key in ['obstacle', 'obastcle', 'obactcle', 'obatcle']) and is_image:
+                buckets['obstacle'].append(fname)
+            if 'dragon' in low and low.endswith('.gif'):
+                buckets['dragon_gif'].append(fname)
+        return buckets
 
     def load_all(self):
+        files = self._scan_images_dir()
+        wanted = list(self.NAMED_FILES)
+        for key in ('ticket', 'drum', 'rock', 'bamboo', 'day', 'night', 'obstacle'):
+            wanted.extend(files[key])
+        self._preload(wanted)
+
         # Samurai frames from images/ folder
         left = self._load_image_file('Running_leftLeg.png')
         right = self._load_image_file('RIght_leg.png') or self._load_image_file('Right_leg.png')
@@ -162,60 +429,32 @@ class AssetLoader:
         duck = self._load_image_file('Down_samrai.png')
 
         # Fallback simple silhouettes if any missing
-        def placeholder_samurai(w=100, h=120):
-            return self._make_surface(w, h, lambda s: pygame.draw.rect(s, (50,50,50), (20, 20, w-40, h-40), border_radius=10))
-
-        self.sprites['run'] = [left or placeholder_samurai(), right or (left and pygame.transform.flip(left, True, False)) or placeholder_samurai()]
-        self.sprites['jump'] = jump or (still or placeholder_samurai())
-        self.sprites['duck'] = duck or self._make_surface(120, 80, lambda s: pygame.draw.rect(s, (50,50,50), (10,20,100,50), border_radius=8))
-
-        # FX
-        self.sprites['tornado'] = self._make_surface(120, 120, lambda s: [
-            pygame.draw.arc(s, (200,200,255), (0,0,120,120), 0.5, 2.5, 6),
-            pygame.draw.arc(s, (160,160,220), (10,10,100,100), 0.6, 2.6, 5)
-        ])
+        placeholder = procedural_sprite('placeholder_samurai')
+        self.sprites['run'] = [left or placeholder, right or (left and pygame.transform.flip(left, True, False)) or placeholder]
+        self.sprites['jump'] = jump or (still or placeholder)
+        self.sprites['duck'] = duck or procedural_sprite('placeholder_duck')
+
+        # FX (only drawn once a powerup actually shows them)
+        self.sprites.register('tornado', functools.partial(procedural_sprite, 'tornado'))
         # Blue dash flame
-        self.sprites['dash_flame'] = self._make_surface(80, 80, lambda s: [
-            pygame.draw.circle(s, (100,180,255,180), (40,40), 28),
-            pygame.draw.circle(s, (150,220,255,160), (40,40), 18)
-        ])
+        self.sprites.register('dash_flame', functools.partial(procedural_sprite, 'dash_flame'))
         # Ticket powerups
-        def ticket(color):
-            return self._make_surface(40, 30, lambda s: [
-                pygame.draw.rect(s, color, (0,0,40,30), border_radius=6),
-                pygame.draw.rect(s, (255,255,255,60), (4,4,32,22), 2, border_radius=4)
-            ])
-        self.sprites['ticket_blue'] = ticket((80,160,255))
-        self.sprites['ticket_yellow'] = ticket((255,215,64))
+        self.sprites['ticket_blue'] = procedural_sprite('ticket_blue')
+        self.sprites['ticket_yellow'] = procedural_sprite('ticket_yellow')
         # Try to override with provided ticket images
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if 'ticket' in low and any(ext in low for ext in ['.png', '.jpg', '.jpeg']):
-                    img = self._load_image_file(fname)
-                    if img is None:
-                        continue
-                    if 'blue' in low:
-                        self.sprites['ticket_blue'] = img
-                    elif 'yellow' in low:
-                        self.sprites['ticket_yellow'] = img
-        except Exception:
-            pass
+        for fname in files['ticket']:
+            low = fname.lower()
+            img = self._load_image_file(fname)
+            if img is None:
+                continue
+            if 'blue' in low:
+                self.sprites['ticket_blue'] = img
+            elif 'yellow' in low:
+                self.sprites['ticket_yellow'] = img
 
         # Obstacles (procedural placeholders)
-        self.sprites['rock'] = self._make_surface(40, 40, lambda s: pygame.draw.circle(s, (130,130,130), (20,20), 18))
-        self.sprites['barrel'] = self._make_surface(70, 70, lambda s: [
-            pygame.draw.rect(s, (139,69,19), (5,5,60,60), border_radius=6),
-            pygame.draw.line(s, (90,50,10), (5,20), (65,20), 4),
-            pygame.draw.line(s, (90,50,10), (5,45), (65,45), 4)
-        ])
-        self.sprites['bamboo'] = self._make_surface(60, 140, lambda s: [
-            pygame.draw.rect(s, (40,160,60), (25,0,10,140)),
-            pygame.draw.line(s, (80,200,100), (25,20), (35,20), 3),
-            pygame.draw.line(s, (80,200,100), (25,60), (35,60), 3),
-            pygame.draw.line(s, (80,200,100), (25,100), (35,100), 3)
-        ])
-        self.sprites['boulder'] = self._make_surface(120, 120, lambda s: pygame.draw.circle(s, (110,110,110), (60,60), 56))
+        for name in ('rock', 'barrel', 'bamboo', 'boulder'):
+            self.sprites[name] = procedural_sprite(name)
 
         # Attempt to override with provided obstacle images if present
         rock_img = self._load_image_file('rock.png')
@@ -233,15 +472,10 @@ class AssetLoader:
 
         # Multiple drum variants: scan folder for any names containing 'drum', 'barrel', or 'dum'
         drum_variants = []
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if ('drum' in low) or ('barrel' in low) or ('dum' in low):
-                    img = self._load_image_file(fname)
-                    if img:
-                        drum_variants.append(img)
-        except Exception:
-            pass
+        for fname in files['drum']:
+            img = self._load_image_file(fname)
+            if img:
+                drum_variants.append(img)
         if drum_variants:
             self.sprites['barrel_variants'] = drum_variants
             # Also set default barrel to first variant
@@ -249,15 +483,10 @@ class AssetLoader:
 
         # Rock variants: scan for names containing 'rock' or 'stone'
         rock_variants = []
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if ('rock' in low) or ('stone' in low):
-                    img = self._load_image_file(fname)
-                    if img:
-                        rock_variants.append(img)
-        except Exception:
-            pass
+        for fname in files['rock']:
+            img = self._load_image_file(fname)
+            if img:
+                rock_variants.append(img)
         if rock_variants:
             self.sprites['rock_variants'] = rock_variants
             self.sprites['rock'] = rock_variants[0]
@@ -268,15 +497,10 @@ class AssetLoader:
 
         # Bamboo variants: scan for names containing 'bamboo'
         bamboo_variants = []
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if 'bamboo' in low:
-                    img = self._load_image_file(fname)
-                    if img:
-                        bamboo_variants.append(img)
-        except Exception:
-            pass
+        for fname in files['bamboo']:
+            img = self._load_image_file(fname)
+            if img:
+                bamboo_variants.append(img)
         if bamboo_variants:
             self.sprites['bamboo_variants'] = bamboo_variants
             self.sprites['bamboo'] = bamboo_variants[0]
@@ -284,30 +508,19 @@ class AssetLoader:
         # Backgrounds: scan for day/night images
         day_bg = None
         night_bg = None
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if ('day' in low) and any(ext in low for ext in ['.png', '.jpg', '.jpeg']):
-                    day_bg = self._load_image_file(fname)
-                if ('night' in low) and any(ext in low for ext in ['.png', '.jpg', '.jpeg']):
-                    night_bg = self._load_image_file(fname)
-        except Exception:
-            pass
+        for fname in files['day']:
+            day_bg = self._load_image_file(fname)
+        for fname in files['night']:
+            night_bg = self._load_image_file(fname)
         if day_bg: self.sprites['bg_day'] = day_bg
         if night_bg: self.sprites['bg_night'] = night_bg
 
         # Generic obstacle variants: names containing 'obstacle' or common typos
         generic_variants = []
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if any(key in low for key in ['obstacle', 'obastcle', 'obactcle', 'obatcle']):
-                    if any(ext in low for ext in ['.png', '.jpg', '.jpeg']):
-                        img = self._load_image_file(fname)
-                        if img:
-                            generic_variants.append(img)
-        except Exception:
-            pass
+        for fname in files['obstacle']:
+            img = self._load_image_file(fname)
+            if img:
+                generic_variants.append(img)
         if generic_variants:
             self.sprites['obstacle_variants'] = generic_variants
 
@@ -323,53 +536,76 @@ class AssetLoader:
         def revive_alpha_from_rgb(surf, threshold=1):
             # Rebuild alpha channel from RGB brightness so transparent GIFs become visible
             import numpy as _np
-            w, h = surf.get_width(), surf.get_height()
-            out = pygame.Surface((w, h), pygame.SRCALPHA)
-            rgb = pygame.surfarray.array3d(surf)  # (w,h,3)
-            # Copy RGB
-            pygame.surfarray.blit_array(out, rgb)
+            # Copy keeps RGB as-is (even under zero alpha); only the alpha plane is rewritten
+            if surf.get_flags() & pygame.SRCALPHA:
+                out = surf.copy()
+            else:
+                out = surf.convert_alpha()
+            w, h = out.get_size()
+            rgb = pygame.surfarray.pixels3d(out)  # (w,h,3) zero-copy view
             # Compute brightness -> alpha; set fully opaque where above threshold
-            gray = (0.299*rgb[:, :, 0] + 0.587*rgb[:, :, 1] + 0.114*rgb[:, :, 2])
-            alpha = _np.where(gray > threshold, 255, 0).astype(_np.uint8)
+            if HAS_NUMBA:
+                alpha = _np.empty((w, h), _np.uint8)
+                _luma_threshold(rgb, threshold, alpha)
+            else:
+                # Same integer luma as the kernel: uint16 holds 256 * 255
+                luma = rgb @ _np.array([77, 150, 29], _np.uint16)
+                alpha = (luma > threshold * 256).astype(_np.uint8)
+                alpha *= 255
+            del rgb
             aview = pygame.surfarray.pixels_alpha(out)
             aview[:, :] = alpha
             del aview
             return out
 
-        def tint_frames(frames, color):
-            out = []
-            for f in frames:
-                s = f.copy()
-                tint = pygame.Surface(s.get_size(), pygame.SRCALPHA)
-                tint.fill(color)
-                s.blit(tint, (0,0), special_flags=pygame.BLEND_RGB_MULT)
-                out.append(s)
+        def tint_frames(frames, colors):
+            # Returns one frame list per color; source pixels are read once for all tints
+            out = [[None] * len(frames) for _ in colors]
+            if HAS_NUMPY:
+                tints = np.array(colors, np.uint16)[:, None, None, None, :]
+                # Stack equally sized frames so one broadcast covers every (color, frame) pair
+                groups = {}
+                for i, f in enumerate(frames):
+                    groups.setdefault(f.get_size(), []).append(i)
+                for idxs in groups.values():
+                    src = np.stack([pygame.surfarray.array3d(frames[i]) for i in idxs]).astype(np.uint16)
+                    # (colors, frames, w, h, rgb); same rounding as BLEND_RGB_MULT
+                    tinted = ((src[None] * tints + 255) >> 8).astype(np.uint8)
+                    for ci in range(len(colors)):
+                        for k, i in enumerate(idxs):
+                            s = frames[i].copy()
+                            view = pygame.surfarray.pixels3d(s)
+                            view[...] = tinted[ci, k]
+                            del view
+                            out[ci][i] = s
+            else:
+                for f_i, f in enumerate(frames):
+                    for ci, color in enumerate(colors):
+                        s = f.copy()
+                        tint = pygame.Surface(s.get_size(), pygame.SRCALPHA)
+                        tint.fill(color)
+                        s.blit(tint, (0,0), special_flags=pygame.BLEND_RGB_MULT)
+                        out[ci][f_i] = s
             return out
 
         dragon_gif = None
         gif_frames = None
-        try:
-            for fname in os.listdir(self.images_dir):
-                low = fname.lower()
-                if 'dragon' in low and low.endswith('.gif'):
-                    path = os.path.join(self.images_dir, fname)
-                    try:
-                        from PIL import Image
-                        im = Image.open(path)
-                        frames = []
-                        n = getattr(im, 'n_frames', 1)
-                        for i in range(max(1, n)):
-                            im.seek(i)
-                            fr = im.convert('RGBA')
-                            w, h = fr.size
-                            surf = pygame.image.fromstring(fr.tobytes(), (w, h), 'RGBA')
-                            frames.append(surf)
-                        gif_frames = frames
-                    except Exception:
-                        dragon_gif = self._load_image_file(fname)
-                    break
-        except Exception:
-            pass
+        for fname in files['dragon_gif'][:1]:
+            path = os.path.join(self.images_dir, fname)
+            try:
+                from PIL import Image
+                im = Image.open(path)
+                frames = []
+                n = getattr(im, 'n_frames', 1)
+                for i in range(max(1, n)):
+                    im.seek(i)
+                    fr = im.convert('RGBA')
+                    w, h = fr.size
+                    surf = pygame.image.fromstring(fr.tobytes(), (w, h), 'RGBA')
+                    frames.append(surf)
+                gif_frames = frames
+            except Exception:
+                dragon_gif = self._load_image_file(fname)
 
         if gif_frames:
             proc = []
@@ -383,20 +619,21 @@ class AssetLoader:
             if len(proc) == 1:
                 f1 = proc[0]
                 w, h = f1.get_size()
-                f2s = pygame.transform.smoothscale(f1, (w, max(1, int(h*0.92))))
+                f2s = pygame.transform.scale(f1, (w, max(1, int(h*0.92))))
                 canvas = pygame.Surface((w, h), pygame.SRCALPHA)
                 canvas.blit(f2s, (0, h - f2s.get_height()))
                 proc.append(crop_visible(canvas))
-            self.sprites['dragon'] = proc
-            try:
-                m0 = pygame.mask.from_surface(proc[0])
-                print(f"Dragon.gif frames={len(proc)} pixels0={m0.count()} size0={proc[0].get_size()}")
-            except Exception:
-                pass
+            self.sprites['dragon'] = [_display_format(f) for f in proc]
+            if Config.DEBUG_ASSETS:
+                try:
+                    m0 = pygame.mask.from_surface(proc[0])
+                    print(f"Dragon.gif frames={len(proc)} pixels0={m0.count()} size0={proc[0].get_size()}")
+                except Exception:
+                    pass
         elif dragon_gif is not None:
             f1 = dragon_gif.convert_alpha() if hasattr(dragon_gif, 'convert_alpha') else dragon_gif
             w, h = f1.get_size()
-            f2 = pygame.transform.smoothscale(f1, (w, max(1, int(h*0.9))))
+            f2 = pygame.transform.scale(f1, (w, max(1, int(h*0.9))))
             canvas2 = pygame.Surface((w, h), pygame.SRCALPHA)
             canvas2.blit(f2, (0, h - f2.get_height()))
             try:
@@ -406,21 +643,23 @@ class AssetLoader:
                 pass
             c1 = crop_visible(f1)
             c2 = crop_visible(canvas2)
-            self.sprites['dragon'] = [c1, c2]
+            self.sprites['dragon'] = [_display_format(c1), _display_format(c2)]
         else:
-            base1 = self._make_surface(110, 90, lambda s: pygame.draw.polygon(s, (180,180,180), [(10,70),(60,20),(100,50),(60,60)]))
-            base2 = self._make_surface(110, 90, lambda s: pygame.draw.polygon(s, (180,180,180), [(10,50),(60,10),(100,40),(60,70)]))
+            base1 = procedural_sprite('dragon_base1')
+            base2 = procedural_sprite('dragon_base2')
             self.sprites['dragon'] = [base1, base2]
 
-        # Color variants (used for speed/height variation)
-        self.sprites['dragon_red'] = tint_frames(self.sprites['dragon'], (255, 120, 120))
-        self.sprites['dragon_green'] = tint_frames(self.sprites['dragon'], (120, 255, 120))
-        self.sprites['dragon_black'] = tint_frames(self.sprites['dragon'], (90, 90, 90))
+        # Color variants (used for speed/height variation); user frames are never tinted
         self.sprites['dragon_user_frames'] = bool(gif_frames or dragon_gif)
         if self.sprites['dragon_user_frames']:
             self.sprites['dragon_red'] = list(self.sprites['dragon'])
             self.sprites['dragon_green'] = list(self.sprites['dragon'])
             self.sprites['dragon_black'] = list(self.sprites['dragon'])
+        else:
+            red, green, black = tint_frames(self.sprites['dragon'], [(255, 120, 120), (120, 255, 120), (90, 90, 90)])
+            self.sprites['dragon_red'] = red
+            self.sprites['dragon_green'] = green
+            self.sprites['dragon_black'] = black
 
         # Obstacles-in-folder mode: scan images/obstacles or images/obatcles
         folder_paths = []
@@ -444,7 +683,7 @@ class AssetLoader:
                     if 'dragon' in low and low.endswith('.gif'):
                         gif_img = pygame.image.load(full).convert_alpha()
                         w, h = gif_img.get_size()
-                        f2 = pygame.transform.smoothscale(gif_img, (w, max(1, int(h*0.9))))
+                        f2 = pygame.transform.scale(gif_img, (w, max(1, int(h*0.9))))
                         canvas2 = pygame.Surface((w, h), pygame.SRCALPHA)
                         canvas2.blit(f2, (0, h - f2.get_height()))
                         # Rebuild alpha in case GIF lost it, then crop
@@ -455,13 +694,14 @@ class AssetLoader:
                             pass
                         c1 = crop_visible(gif_img)
                         c2 = crop_visible(canvas2)
-                        folder_dragons.append({'name': fname, 'frames': [c1, c2]})
+                        folder_dragons.append({'name': fname, 'frames': [_display_format(c1), _display_format(c2)]})
                         # Diagnostics: print visible pixel count for folder dragon
-                        try:
-                            m1 = pygame.mask.from_surface(c1); m2 = pygame.mask.from_surface(c2)
-                            print(f"Dragon.gif loaded (folder): {fname} Visible pixels: f1={m1.count()} f2={m2.count()} size1={c1.get_size()} size2={c2.get_size()}")
-                        except Exception:
-                            pass
+                        if Config.DEBUG_ASSETS:
+                            try:
+                                m1 = pygame.mask.from_surface(c1); m2 = pygame.mask.from_surface(c2)
+                                print(f"Dragon.gif loaded (folder): {fname} Visible pixels: f1={m1.count()} f2={m2.count()} size1={c1.get_size()} size2={c2.get_size()}")
+                            except Exception:
+                                pass
                     else:
                         img = pygame.image.load(full).convert_alpha()
                         folder_obstacles.append({'name': fname, 'img': img})
@@ -510,75 +750,225 @@ class AssetLoader:
             except Exception:
                 pass
 
-        # Items
-        self.sprites['talisman'] = self._make_surface(30, 40, lambda s: [
-            pygame.draw.rect(s, (255, 235, 120), (5,5,20,30), border_radius=4),
-            pygame.draw.line(s, (220, 160, 40), (10,12), (20,28), 3)
-        ])
-        self.sprites['scroll'] = self._make_surface(40, 40, lambda s: pygame.draw.rect(s, (220,220,220), (5,8,30,24), border_radius=4))
-
-        # Env placeholders
-        self.sprites['pagoda'] = self._make_surface(150, 120, lambda s: [
-            pygame.draw.rect(s, (60,60,80), (50,40,50,70)),
-            pygame.draw.polygon(s, (80,80,110), [(35,40),(75,10),(115,40)])
-        ])
-        self.sprites['lantern'] = self._make_surface(40, 60, lambda s: [
-            pygame.draw.ellipse(s, (255,140,0), (5,10,30,40)),
-            pygame.draw.circle(s, (255,220,120), (20,30), 6)
-        ])
+        # Decoded copies and the load memo are no longer needed once everything is converted
+        self._decoded.clear()
+        self._images.clear()
+
+        # Env placeholders: Environment reads these as soon as a game is reset, so build them now
+        for name in ('pagoda', 'lantern'):
+            self.sprites[name] = procedural_sprite(name)
+        # Items are built on first use
+        for name in ('talisman', 'scroll'):
+            self.sprites.register(name, functools.partial(procedural_sprite, name))
 
 # ==============================================================================
 # 4. PARTICLE SYSTEM
 # ==============================================================================
-class Particle:
-    def __init__(self, x, y, p_type):
-        self.x = x
-        self.y = y
-        self.type = p_type
-        self.life = 1.0 # 0.0 to 1.0
-        self.decay = random.uniform(0.02, 0.05)
-        
-        if p_type == 'petal': # Cherry blossom
-            self.vx = random.uniform(-1, 1)
-            self.vy = random.uniform(0.5, 1.5)
-            self.color = (255, 183, 197)
-            self.size = random.randint(3, 5)
-        elif p_type == 'debris': # Broken wood
-            self.vx = random.uniform(-5, 5)
-            self.vy = random.uniform(-6, -2)
-            self.color = (139, 69, 19)
-            self.size = random.randint(4, 7)
-        elif p_type == 'sparkle': # Powerup
-            self.vx = random.uniform(-1, 1)
-            self.vy = random.uniform(-2, -0.5)
-            self.color = (255, 255, 0)
-            self.size = random.randint(2, 4)
-        elif p_type == 'dust': # Running dust
-            self.vx = random.uniform(-2, -0.5)
-            self.vy = random.uniform(-0.5, 0)
-            self.color = (200, 200, 200)
-            self.size = random.randint(3, 6)
+if HAS_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _step_particles(xs, ys, vxs, vys, lives, decays, types, sizes, n, debris, gravity):
+        # Advance and compact in one sweep; returns the new live count
+        live = 0
+        for i in range(n):
+            life = lives[i] - decays[i]
+            if life <= 0:
+                continue
+            vy = vys[i]
+            xs[live] = xs[i] + vxs[i]
+            ys[live] = ys[i] + vy
+            if types[i] == debris:
+                vy += gravity
+            vxs[live] = vxs[i]
+            vys[live] = vy
+            lives[live] = life
+            decays[live] = decays[i]
+            types[live] = types[i]
+            sizes[live] = sizes[i]
+            live += 1
+        return live
+
+class ParticlePool:
+    """
+    Structure-of-arrays particle store. Each live particle is an index into
+    parallel arrays, so a frame update is a few vector ops instead of one
+    Python method call per particle. Falls back to plain lists without NumPy.
+    """
+    # p_type -> (type id, vx range, vy range, size range)
+    KINDS = {
+        'petal': (0, (-1, 1), (0.5, 1.5), (3, 5)),      # Cherry blossom
+        'debris': (1, (-5, 5), (-6, -2), (4, 7)),       # Broken wood
+        'sparkle': (2, (-1, 1), (-2, -0.5), (2, 4)),    # Powerup
+        'dust': (3, (-2, -0.5), (-0.5, 0), (3, 6)),     # Running dust
+    }
+    # Indexed by type id
+    COLORS = [(255, 183, 197), (139, 69, 19), (255, 255, 0), (200, 200, 200)]
+    DEBRIS = 1
+    DEBRIS_GRAVITY = 0.4
+    FIELDS = ('xs', 'ys', 'vxs', 'vys', 'lives', 'decays', 'types', 'sizes')
+
+    # Pre-rendered circle sprites keyed by (color, size), shared by all pools
+    _surf_cache = {}
+    # Fade is rounded to the nearest multiple of this (top step clamps to 255); faded copies keyed by (color, size, alpha)
+    ALPHA_STEP = 8
+    _fade_cache = {}
+
+    def __init__(self, capacity=256):
+        self.n = 0
+        self.capacity = capacity
+        for name in self.FIELDS:
+            setattr(self, name, self._new_array(name, capacity))
+        self._prerender()
+        if HAS_NUMBA:
+            # Compile (or load from cache) now rather than on the first gameplay frame
+            self._step(0)
+
+    def __len__(self):
+        return self.n
+
+    def _new_array(self, name, size):
+        if not HAS_NUMPY:
+            return [0] * size
+        dtype = np.int8 if name in ('types', 'sizes') else np.float32
+        return np.zeros(size, dtype)
+
+    def _grow(self):
+        extra = self.capacity
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            if HAS_NUMPY:
+                arr = np.concatenate([arr, self._new_array(name, extra)])
+            else:
+                arr.extend(self._new_array(name, extra))
+            setattr(self, name, arr)
+        self.capacity += extra
+
+    def emit(self, x, y, p_type):
+        type_id, (vx0, vx1), (vy0, vy1), (s0, s1) = self.KINDS[p_type]
+        if self.n == self.capacity:
+            self._grow()
+        i = self.n
+        # Inline uniform/randint on random.random(): same distributions without the Python-level wrappers
+        rnd = random.random
+        self.xs[i] = x
+        self.ys[i] = y
+        self.lives[i] = 1.0 # 0.0 to 1.0
+        self.decays[i] = 0.02 + 0.03 * rnd()
+        self.vxs[i] = vx0 + (vx1 - vx0) * rnd()
+        self.vys[i] = vy0 + (vy1 - vy0) * rnd()
+        self.types[i] = type_id
+        self.sizes[i] = s0 + int(rnd() * (s1 - s0 + 1))
+        self.n += 1
+
+    def _step(self, n):
+        return _step_particles(self.xs, self.ys, self.vxs, self.vys, self.lives, self.decays,
+                               self.types, self.sizes, n, self.DEBRIS, self.DEBRIS_GRAVITY)
 
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= self.decay
-        
-        if self.type == 'debris':
-            self.vy += 0.4 # Gravity for debris
+        n = self.n
+        if n == 0:
+            return
+        if HAS_NUMBA:
+            live = self._step(n)
+        elif HAS_NUMPY:
+            self.xs[:n] += self.vxs[:n]
+            self.ys[:n] += self.vys[:n]
+            self.lives[:n] -= self.decays[:n]
+            # Gravity for debris
+            self.vys[:n][self.types[:n] == self.DEBRIS] += self.DEBRIS_GRAVITY
+            alive = self.lives[:n] > 0
+            live = int(np.count_nonzero(alive))
+            if live != n:
+                for name in self.FIELDS:
+                    arr = getattr(self, name)
+                    arr[:live] = arr[:n][alive]
+        else:
+            xs, ys, vxs, vys, lives = self.xs, self.ys, self.vxs, self.vys, self.lives
+            for i in range(n):
+                xs[i] += vxs[i]
+                ys[i] += vys[i]
+                lives[i] -= self.decays[i]
+                if self.types[i] == self.DEBRIS:
+                    vys[i] += self.DEBRIS_GRAVITY
+            keep = [i for i in range(n) if lives[i] > 0]
+            live = len(keep)
+            if live != n:
+                for name in self.FIELDS:
+                    arr = getattr(self, name)
+                    arr[:live] = [arr[i] for i in keep]
+        self.n = live
+
+    @classmethod
+    def _get_surface(cls, color, size):
+        key = (color, size)
+        s = cls._surf_cache.get(key)
+        if s is None:
+            s = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+            pygame.draw.circle(s, color, (size, size), size)
+            s = _display_format(s)
+            cls._surf_cache[key] = s
+        return s
+
+    @classmethod
+    def _prerender(cls):
+        # Every (color, size) a particle can take is known up front, so draw them all now
+        for type_id, _vx, _vy, (lo, hi) in cls.KINDS.values():
+            for size in range(lo, hi + 1):
+                cls._get_surface(cls.COLORS[type_id], size)
+
+    def _column(self, name):
+        arr = getattr(self, name)[:self.n]
+        return arr.tolist() if HAS_NUMPY else arr
+
+    @classmethod
+    def _get_faded(cls, color, size, alpha):
+        # Copies of the cached circle at fixed alpha steps, so one batch can mix fades
+        key = (color, size, alpha)
+        s = cls._fade_cache.get(key)
+        if s is None:
+            s = cls._get_surface(color, size).copy()
+            s.set_alpha(alpha)
+            cls._fade_cache[key] = s
+        return s
 
     def draw(self, surf):
-        if self.life > 0:
-            alpha = int(self.life * 255)
-            # Create a temporary surface for transparency
-            s = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*self.color, alpha), (self.size, self.size), self.size)
-            surf.blit(s, (self.x - self.size, self.y - self.size))
+        colors = self.COLORS
+        step = self.ALPHA_STEP
+        half = step // 2
+        faded = self._get_faded
+        seq = [(faded(colors[t], size, min(255, (int(life * 255) + half) // step * step)), (x - size, y - size))
+               for x, y, life, t, size in zip(self._column('xs'), self._column('ys'), self._column('lives'),
+                                              self._column('types'), self._column('sizes'))
+               if life > 0]
+        surf.blits(seq, doreturn=False)
 
 # ==============================================================================
 # 5. GAME ENTITIES
 # ==============================================================================
+def _identity_cached(cache, key, obj, build):
+    """
+    Memoise build() for obj in cache under key, where key includes id(obj).
+    Entries are stored as (obj, value) and rebuilt if a different object has
+    since been given the same id.
+    """
+    hit = cache.get(key)
+    if hit is None or hit[0] is not obj:
+        hit = cache[key] = (obj, build())
+    return hit[1]
+
+# Obstacle sprite masks by id(surface); only filled when Config.PIXEL_PERFECT is on
+_MASK_CACHE = {}
+
+def _mask_for(surf):
+    # Obstacle sprites come from class-level caches shared by every spawn, so each needs its mask built once
+    return _identity_cached(_MASK_CACHE, id(surf), surf, lambda: pygame.mask.from_surface(surf))
+
+
 class Samurai:
+    # Heights the samurai takes on: ducking, initial spawn, standing/jumping
+    SPRITE_HEIGHTS = (50, 72, 90)
+    # (tornado surface, [rotations at 10 degree steps]); shared across resets
+    _tornado_rots = (None, [])
+
     def __init__(self, assets):
         self.assets = assets
         self.reset()
@@ -603,7 +993,37 @@ class Samurai:
         self.tornado_ready = False   # single-use destroy next obstacle
         self.double_jump_item = False 
         self.jump_anim_t = 0
-        
+        self._rescale_cache()
+
+    def _rescale_cache(self):
+        # Pre-scale every pose at every height once; draw() only does lookups.
+        # Keyed by (asset_id, w, h); asset_id is 'duck', 'jump' or ('run', i).
+        self._scaled = {}
+        # Pose surface -> collision mask, filled on demand when Config.PIXEL_PERFECT is on
+        self._masks = {}
+        poses = [('duck', self.assets['duck']), ('jump', self.assets['jump'])]
+        poses += [(('run', i), f) for i, f in enumerate(self.assets['run'])]
+        for h in self.SPRITE_HEIGHTS:
+            for asset_id, base in poses:
+                self._scaled[(asset_id, self.width, h)] = _display_format(pygame.transform.smoothscale(base, (self.width, h)))
+
+    def _tornado_frames(self):
+        # Built on first use only, so runs without a yellow powerup never pay for it
+        orig, rots = Samurai._tornado_rots
+        img = self.assets['tornado']
+        if orig is not img:
+            rots = [_display_format(pygame.transform.rotate(img, a)) for a in range(0, 360, 10)]
+            Samurai._tornado_rots = (img, rots)
+        return rots
+
+    def _scaled_sprite(self, asset_id, base, w, h):
+        # Lookup with a build-on-miss fallback (e.g. the lazily built dash flame)
+        key = (asset_id, w, h)
+        img = self._scaled.get(key)
+        if img is None:
+            img = self._scaled[key] = _display_format(pygame.transform.smoothscale(base, (w, h)))
+        return img
+
 
     def jump(self, audio):
         if self.is_ducking:
@@ -668,70 +1088,127 @@ class Samurai:
             self.anim_timer = 0
 
     def draw(self, surf):
+        blit = surf.blit
+        assets = self.assets
+        x, y, w, h = self.x, self.y, self.width, self.height
         # Draw Effects (Behind character)
         if self.dash_timer > 0:
             # Blue dash effect
-            flame = self.assets.get('dash_flame', None)
+            flame = assets.get('dash_flame', None)
             if flame:
                 # Scale dash flame roughly to character size
-                f = pygame.transform.smoothscale(flame, (int(self.width*1.6), int(self.height*1.2)))
-                surf.blit(f, (self.x - int(self.width*0.6), self.y - int(self.height*0.15)))
+                f = self._scaled_sprite('dash_flame', flame, int(w*1.6), int(h*1.2))
+                blit(f, (x - int(w*0.6), y - int(h*0.15)))
         
         if self.tornado_ready:
             # Show tornado ready effect subtly
-            spin_angle = (pygame.time.get_ticks() // 10) % 360
-            orig_img = self.assets['tornado']
-            rot_img = pygame.transform.rotate(orig_img, spin_angle)
-            rect = rot_img.get_rect(center=(self.x + 30, self.y + 45))
-            surf.blit(rot_img, rect)
-
-        # Draw Sprite (scaled to width/height)
-        img = None
-        if self.is_ducking and not self.is_jumping:
-            base = self.assets['duck']
-            img = pygame.transform.smoothscale(base, (self.width, self.height))
-        elif self.is_jumping:
-            base = self.assets['jump']
-            scaled = pygame.transform.smoothscale(base, (self.width, self.height))
-            # No rotation for jump; show provided jump sprite as-is
-            surf.blit(scaled, (self.x, self.y))
-            if self.double_jump_item:
-                surf.blit(self.assets['talisman'], (self.x + 10, self.y - 40))
-            return
-        else:
-            base = self.assets['run'][self.run_frame]
-            img = pygame.transform.smoothscale(base, (self.width, self.height))
-        
+            rot_img = self._tornado_frames()[(pygame.time.get_ticks() // 100) % 36]
+            blit(rot_img, rot_img.get_rect(center=(x + 30, y + 45)))
+
+        # Draw Sprite (scaled to width/height); no rotation for jump, the jump sprite is shown as-is
         # Align top-left so feet meet ground
-        surf.blit(img, (self.x, self.y))
+        blit(self._current_scaled_surface(), (x, y))
 
         # Visual indicator for double jump
         if self.double_jump_item:
-            surf.blit(self.assets['talisman'], (self.x + 10, self.y - 40))
+            blit(assets['talisman'], (x + 10, y - 40))
 
     def get_hitbox(self):
         # Tighter player hitbox to avoid early collisions
         return pygame.Rect(self.x + 14, self.y + 12, self.width - 28, self.height - 24)
 
+    def _current_scaled_surface(self):
+        # Cached pose surface at the current size
+        if self.is_ducking and not self.is_jumping:
+            return self._scaled_sprite('duck', self.assets['duck'], self.width, self.height)
+        if self.is_jumping:
+            return self._scaled_sprite('jump', self.assets['jump'], self.width, self.height)
+        return self._scaled_sprite(('run', self.run_frame), self.assets['run'][self.run_frame], self.width, self.height)
+
+    def get_mask(self):
+        # Masks live with this samurai's pose cache, so they go when reset_game replaces it
+        surf = self._current_scaled_surface()
+        mask = self._masks.get(surf)
+        if mask is None:
+            mask = self._masks[surf] = pygame.mask.from_surface(surf)
+        return mask
+
     def get_surface_and_rect(self):
         # Returns current scaled surface and its rect at (x, y)
-        if self.is_ducking and not self.is_jumping:
-            base = self.assets['duck']
-        elif self.is_jumping:
-            base = self.assets['jump']
-        else:
-            base = self.assets['run'][self.run_frame]
-        surf = pygame.transform.smoothscale(base, (self.width, self.height))
-        return surf, pygame.Rect(self.x, self.y, self.width, self.height)
+        return self._current_scaled_surface(), pygame.Rect(self.x, self.y, self.width, self.height)
+
+
+# (w, h, extra_bottom) by id(img) for 'folder' obstacles; the same few images spawn repeatedly
+_FOLDER_PAD_CACHE = {}
+
+def _folder_obstacle_size(img):
+    """On-screen (w, h) for a folder image and its transparent padding below the visible bottom."""
+    return _identity_cached(_FOLDER_PAD_CACHE, id(img), img, lambda: _measure_folder_image(img))
+
+def _measure_folder_image(img):
+    # Maintain aspect ratio with a reasonable on-screen visible height, compensating for transparent padding
+    iw, ih = img.get_width(), img.get_height()
+    # Visible bounding box from mask to detect transparent margins
+    vis_rect = pygame.mask.from_surface(img).get_bounding_rects()
+    if vis_rect:
+        vr = vis_rect[0]
+        vis_h = max(1, vr.height)
+        # Scale so that VISIBLE height maps to target_h (smaller overall)
+        target_h = max(28, min(72, int(vis_h * 0.75)))
+        s = target_h / vis_h
+        target_w = max(36, int(iw * s))
+        scaled_total_h = max(10, int(ih * s))
+        # Extra transparent padding at the bottom after scaling
+        extra_bottom = int((ih - (vr.top + vr.height)) * s)
+        return (target_w, scaled_total_h, extra_bottom)
+    # Fallback if mask empty
+    target_h = max(28, min(72, int(ih * 0.75)))
+    s = target_h / max(1, ih)
+    return (max(36, int(iw * s)), int(ih * s), 0)
+
+# Opaque bounding rect in image pixels by id(img); user images carry transparent margins
+_VISIBLE_CACHE = {}
+
+def _visible_box(rect, imgs):
+    """Part of rect the opaque pixels of imgs cover once scaled into it (union over all frames)."""
+    box = None
+    for img in imgs:
+        vis = _identity_cached(_VISIBLE_CACHE, id(img), img, img.get_bounding_rect)
+        box = vis if box is None else box.union(vis)
+    iw, ih = imgs[0].get_size()
+    if not box or not iw or not ih:
+        return rect.copy()
+    sx, sy = rect.w / iw, rect.h / ih
+    return pygame.Rect(rect.x + int(box.x * sx), rect.y + int(box.y * sy),
+                       max(1, int(box.w * sx)), max(1, int(box.h * sy)))
 
 
 class Obstacle:
+    # Keyed by (w, h, id(img)): 36 rotations at 10 degree steps, shared by all boulders
+    _boulder_rot_cache = {}
+    # Keyed by (w, h, id(img)): scaled sprite; the same variants spawn over and over at the same size
+    _scaled_cache = {}
+    # Keyed by (w, h, id(frames)): per-frame dragon layers (outline, silhouette, scaled), filled on first use
+    _dragon_layer_cache = {}
+    # 8-neighbour offsets used to thicken the dragon outline
+    OUTLINE_OFFSETS = [(-2,0),(2,0),(0,-2),(0,2),(-1,-1),(1,-1),(-1,1),(1,1)]
+    # Obstacles further than this outside the screen skip per-frame visual work
+    CULL_MARGIN = 50
+    # Hitbox shrink (inflate amounts) per obstacle type; anything else uses DEFAULT_HITBOX_PAD
+    HITBOX_PAD = {'bamboo': (-16, -10), 'boulder': (-12, -12), 'dragon': (-18, -12)}
+    DEFAULT_HITBOX_PAD = (-18, -18)
+
     def __init__(self, x, o_type, assets, data=None):
-        self.x = x
+        # rect.x is the position; _frac carries the sub-pixel part of the scroll
+        self._frac = 0.0
         self.type = o_type
         self.assets = assets
         self.passed = False
         self.rotation = 0
+        # Flying/animated obstacle ('dragon_*', 'folder_dragon'); checked every frame, so resolve once
+        self.is_dragon = 'dragon' in o_type
+        # Scroll speed multiplier, fixed per obstacle so update() needs no type dispatch
+        self.speed_mul = 1.3 if o_type == 'boulder' else 1.0 # Boulders roll faster than scrolling
         
         if o_type == 'rock':
             if 'obstacle_variants' in assets and assets['obstacle_variants']:
@@ -798,30 +1275,9 @@ class Obstacle:
         elif o_type == 'folder':
             # Generic ground obstacle with provided image
             self.img = data['img'] if data and 'img' in data else assets['rock']
-            # Maintain aspect ratio with a reasonable on-screen visible height, compensating for transparent padding
-            iw, ih = self.img.get_width(), self.img.get_height()
-            # Visible bounding box from mask to detect transparent margins
-            vis_mask = pygame.mask.from_surface(self.img)
-            vis_rect = vis_mask.get_bounding_rects()
-            if vis_rect:
-                vr = vis_rect[0]
-                vis_h = max(1, vr.height)
-                # Scale so that VISIBLE height maps to target_h (smaller overall)
-                target_h = max(28, min(72, int(vis_h * 0.75)))
-                s = target_h / vis_h
-                target_w = max(36, int(iw * s))
-                scaled_total_h = max(10, int(ih * s))
-                # Extra transparent padding at the bottom after scaling
-                extra_bottom = int((ih - (vr.top + vr.height)) * s)
-                # Place so the VISIBLE bottom sits on ground
-                y_top = Config.GROUND_Y - (scaled_total_h - extra_bottom)
-                self.rect = pygame.Rect(x, y_top, target_w, scaled_total_h)
-            else:
-                # Fallback if mask empty
-                target_h = max(28, min(72, int(ih * 0.75)))
-                s = target_h / max(1, ih)
-                target_w = max(36, int(iw * s))
-                self.rect = pygame.Rect(x, Config.GROUND_Y - int(ih * s), target_w, int(ih * s))
+            w, h, extra_bottom = _folder_obstacle_size(self.img)
+            # Place so the VISIBLE bottom sits on ground
+            self.rect = pygame.Rect(x, Config.GROUND_Y - (h - extra_bottom), w, h)
         elif o_type == 'folder_dragon':
             # Flying obstacle with provided frames (no tinting)
             frames = data['frames'] if data and 'frames' in data else assets.get('dragon', [])
@@ -846,76 +1302,122 @@ class Obstacle:
             # Clamp within screen vertically
             y_pos = max(0, min(y_pos, Config.SCREEN_HEIGHT - target_h - 1))
             self.rect = pygame.Rect(x, y_pos, target_w, target_h)
-            try:
+            if Config.DEBUG_SPAWN:
                 print(f"Dragon spawn at x={x}, y={y_pos}, size=({target_w},{target_h})")
-            except Exception:
-                pass
-        # Prepare scaled image and mask for pixel-perfect collision
-        self.scaled_img = pygame.transform.smoothscale(self.img, (self.rect.w, self.rect.h))
-        self.mask = pygame.mask.from_surface(self.scaled_img)
+        # Scale once: obstacle sizes never change after spawn (dragons index per-frame tables)
+        if self.is_dragon:
+            self._dragon_layers = self._dragon_layer_table()
+            # Index of the frame scaled_img/_cur_layers currently hold
+            self._last_idx = 0
+            self._cur_layers = self._dragon_frame_layers(0)
+            self.scaled_img = self._cur_layers[2]
+        else:
+            self.scaled_img = self._scaled_sprite()
+            if o_type == 'boulder':
+                self._boulder_rots = self._boulder_rotations()
+        # Collision box: fixed shrink of the draw rect, kept centred on it as it moves.
+        # User images are shrunk from their visible bounds instead, as the draw rect
+        # includes the PNG's transparent margins
+        pad = self.HITBOX_PAD.get('dragon' if self.is_dragon else o_type, self.DEFAULT_HITBOX_PAD)
+        if o_type in ('folder', 'folder_dragon'):
+            box = _visible_box(self.rect, self.frames if self.is_dragon else (self.img,))
+        else:
+            box = self.rect
+        # Never shrink past half the box on either axis
+        self.hitbox = box.inflate(max(pad[0], -(box.w // 2)), max(pad[1], -(box.h // 2)))
+
+    def _scaled_sprite(self):
+        w, h = self.rect.size
+        return _identity_cached(Obstacle._scaled_cache, (w, h, id(self.img)), self.img,
+                                lambda: _display_format(pygame.transform.smoothscale(self.img, (w, h))))
+
+    def _boulder_rotations(self):
+        w, h = self.rect.size
+        return _identity_cached(Obstacle._boulder_rot_cache, (w, h, id(self.img)), self.img,
+                                lambda: [_display_format(pygame.transform.rotate(self.scaled_img, a))
+                                         for a in range(0, 360, 10)])
+
+    def _dragon_layer_table(self):
+        w, h = self.rect.size
+        return _identity_cached(Obstacle._dragon_layer_cache, (w, h, id(self.frames)), self.frames,
+                                lambda: [None] * len(self.frames))
+
+    def _dragon_frame_layers(self, i):
+        # Outline, silhouette and sprite for frame i; built the first time any dragon shows it
+        layers = self._dragon_layers[i]
+        if layers is None:
+            w, h = self.rect.w, self.rect.h
+            scaled = pygame.transform.smoothscale(self.frames[i], (w, h))
+            mask = pygame.mask.from_surface(scaled)
+            # Outline/glow behind dragon for visibility
+            outline_surf = mask.to_surface(setcolor=(0, 0, 0, 180), unsetcolor=(0, 0, 0, 0))
+            outline = pygame.Surface((w + 4, h + 4), pygame.SRCALPHA)
+            for dx, dy in self.OUTLINE_OFFSETS:
+                outline.blit(outline_surf, (2 + dx, 2 + dy))
+            # Solid silhouette from mask to guarantee visible body
+            silhouette = mask.to_surface(setcolor=(30, 30, 30, 220), unsetcolor=(0, 0, 0, 0))
+            layers = (_display_format(outline), _display_format(silhouette), _display_format(scaled))
+            self._dragon_layers[i] = layers
+        return layers
 
     def update(self, speed):
-        move_speed = speed
-        if self.type == 'boulder':
-            move_speed = speed * 1.3 # Rolls faster than scrolling
-            self.rotation -= 10 # Spin visual
-        elif 'dragon' in self.type:
-            move_speed = speed * (self.speed_mul if hasattr(self, 'speed_mul') else 1.2)
+        if self.is_dragon:
             self.frame_idx += 0.15
-            self.img = self.frames[int(self.frame_idx) % len(self.frames)]
-            # Update scaled image and mask for dragons (animated)
-            self.scaled_img = pygame.transform.smoothscale(self.img, (self.rect.w, self.rect.h))
-            self.mask = pygame.mask.from_surface(self.scaled_img)
-
-        self.x -= move_speed
-        self.rect.x = int(self.x)
-        # For non-animated obstacles, ensure mask exists
-        if not hasattr(self, 'scaled_img') or self.scaled_img.get_size() != (self.rect.w, self.rect.h):
-            self.scaled_img = pygame.transform.smoothscale(self.img, (self.rect.w, self.rect.h))
-            self.mask = pygame.mask.from_surface(self.scaled_img)
+        elif self.type == 'boulder':
+            self.rotation -= 10 # Spin visual
 
-    def draw(self, surf):
+        self._frac += speed * self.speed_mul
+        step = int(self._frac)
+        self._frac -= step
+        self.rect.move_ip(-step, 0)
+        self.hitbox.move_ip(-step, 0)
+        if not self.in_view():
+            return
+        if self.is_dragon:
+            i = int(self.frame_idx) % len(self.frames)
+            # frame_idx advances 0.15/tick, so most ticks keep the same frame
+            if i != self._last_idx:
+                self._last_idx = i
+                self.img = self.frames[i]
+                self._cur_layers = self._dragon_frame_layers(i)
+                self.scaled_img = self._cur_layers[2]
+
+    def get_hitbox(self):
+        return self.hitbox
+
+    def get_mask(self):
+        # Unrotated sprite, as boulders have always collided
+        return _mask_for(self.scaled_img)
+
+    def in_view(self):
+        # O(1) cull test; spawns start off the right edge and leave past the left
+        return -self.CULL_MARGIN <= self.rect.right and self.rect.left <= Config.SCREEN_WIDTH + self.CULL_MARGIN
+
+    def blit_items(self):
+        # (surface, dest) pairs for this frame, ready for Surface.blits
+        if not self.in_view():
+            return ()
+        rect = self.rect
         if self.type == 'boulder':
-            base = pygame.transform.smoothscale(self.img, (self.rect.w, self.rect.h))
-            rot_img = pygame.transform.rotate(base, self.rotation)
-            r = rot_img.get_rect(center=self.rect.center)
-            surf.blit(rot_img, r)
-        elif 'dragon' in self.type:
-            scaled = pygame.transform.smoothscale(self.img, (self.rect.w, self.rect.h))
-            # Outline/glow behind dragon for visibility
-            try:
-                out = pygame.Surface((self.rect.w+4, self.rect.h+4), pygame.SRCALPHA)
-                mask = pygame.mask.from_surface(scaled)
-                outline_color = (0, 0, 0, 180)
-                for dx, dy in [(-2,0),(2,0),(0,-2),(0,2),(-1,-1),(1,-1),(-1,1),(1,1)]:
-                    outline_surf = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-                    mask.to_surface(outline_surf, setcolor=outline_color, unsetcolor=(0,0,0,0))
-                    out.blit(outline_surf, (2+dx, 2+dy))
-                surf.blit(out, (self.rect.x-2, self.rect.y-2))
-            except Exception:
-                pass
-            # Always draw a solid silhouette from mask to guarantee visible body
-            try:
-                mask = pygame.mask.from_surface(scaled)
-                sil = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-                mask.to_surface(sil, setcolor=(30,30,30,220), unsetcolor=(0,0,0,0))
-                surf.blit(sil, (self.rect.x, self.rect.y))
-                # Draw the original scaled sprite on top
-                surf.blit(scaled, (self.rect.x, self.rect.y))
-            except Exception:
-                surf.blit(scaled, (self.rect.x, self.rect.y))
-        else:
-            scaled = pygame.transform.smoothscale(self.img, (self.rect.w, self.rect.h))
-            surf.blit(scaled, (self.rect.x, self.rect.y))
+            rot_img = self._boulder_rots[int(self.rotation // 10) % 36]
+            return ((rot_img, rot_img.get_rect(center=rect.center)),)
+        if self.is_dragon:
+            outline, silhouette, scaled = self._cur_layers
+            pos = rect.topleft
+            # Outline, silhouette, then the original scaled sprite on top
+            return ((outline, (pos[0]-2, pos[1]-2)), (silhouette, pos), (scaled, pos))
+        return ((self.scaled_img, rect.topleft),)
+
+# One period of the power-up bob (+/-15 px) in 64 steps, floored to whole pixels
+_BOB_LUT = [math.floor(math.sin(i * 2 * math.pi / 64) * 15) for i in range(64)]
 
 class PowerUp:
     def __init__(self, x, assets):
-        self.x = x
         # Only two tickets: BLUE and YELLOW
         self.type = random.choice(['BLUE', 'YELLOW'])
-        self.y = Config.GROUND_Y - 160
-        self.start_y = self.y
-        self.timer = 0
+        self.start_y = Config.GROUND_Y - 160
+        self._bob_i = 0
+        self._frac = 0.0
         
         if self.type == 'BLUE':
             self.img = assets.get('ticket_blue')
@@ -923,52 +1425,149 @@ class PowerUp:
             self.img = assets.get('ticket_yellow')
         
         # Scale for icon
-        self.img = pygame.transform.scale(self.img, (40, 40))
-        self.rect = pygame.Rect(x, self.y, 40, 40)
+        self.img = _display_format(pygame.transform.scale(self.img, (40, 40)))
+        self.rect = pygame.Rect(x, self.start_y, 40, 40)
 
     def update(self, speed):
-        self.x -= speed
-        self.rect.x = int(self.x)
+        self._frac += speed
+        step = int(self._frac)
+        self._frac -= step
+        self.rect.move_ip(-step, 0)
         
         # Bobbing motion
-        self.timer += 0.1
-        self.y = self.start_y + math.sin(self.timer) * 15
-        self.rect.y = int(self.y)
+        self._bob_i = (self._bob_i + 1) & 63
+        self.rect.y = self.start_y + _BOB_LUT[self._bob_i]
 
     def draw(self, surf):
-        surf.blit(self.img, (self.x, self.y))
+        surf.blit(self.img, self.rect.topleft)
+
+class SpatialIndex:
+    """1D bucket grid over x for anything with a .rect (obstacles, power-ups).
+
+    Everything scrolls left at the same rate and the player never moves in x, so a
+    collision query only has to look at the few buckets around the player.
+    """
+    BUCKET = 64
+
+    def __init__(self):
+        self.buckets = {}     # bucket -> [items]
+        self._where = {}      # id(item) -> (bucket, item)
+        self._reach = 0       # widest half-width seen; queries widen by this
+
+    def sync(self, items):
+        # Insert new items, re-bucket moved ones and drop anything no longer in `items`
+        buckets, where, size = self.buckets, self._where, self.BUCKET
+        live = set()
+        for item in items:
+            key = id(item)
+            live.add(key)
+            b = item.rect.centerx // size
+            old = where.get(key)
+            if old is None:
+                self._reach = max(self._reach, item.rect.w // 2 + 1)
+            elif old[0] == b:
+                continue
+            else:
+                self._drop(old[0], item)
+            buckets.setdefault(b, []).append(item)
+            where[key] = (b, item)
+        for key in [k for k in where if k not in live]:
+            b, item = where.pop(key)
+            self._drop(b, item)
+
+    def discard(self, item):
+        # Immediate removal, for items taken out between syncs
+        hit = self._where.pop(id(item), None)
+        if hit is not None:
+            self._drop(hit[0], item)
+
+    def _drop(self, b, item):
+        bucket = self.buckets[b]
+        bucket.remove(item)
+        if not bucket:
+            del self.buckets[b]
+
+    def first_right_of(self, x):
+        # Leftmost item with rect.x > x: bisect to the first bucket that can hold one, then sweep right
+        size = self.BUCKET
+        keys = sorted(self.buckets)
+        best = None
+        for b in keys[bisect.bisect_left(keys, x // size):]:
+            # Nothing in this bucket or beyond can start left of the best hit
+            if best is not None and b * size - self._reach > best.rect.x:
+                break
+            for item in self.buckets[b]:
+                if item.rect.x > x and (best is None or item.rect.x < best.rect.x):
+                    best = item
+        return best
+
+    def query(self, rect):
+        # Items whose rect could overlap `rect` horizontally, left to right
+        lo = (rect.left - self._reach) // self.BUCKET
+        hi = (rect.right + self._reach) // self.BUCKET
+        found = []
+        for b in range(lo, hi + 1):
+            bucket = self.buckets.get(b)
+            if bucket:
+                found.extend(bucket)
+        return found
 
 # ==============================================================================
 # 6. ENVIRONMENT (Parallax & Day/Night)
 # ==============================================================================
 class Environment:
+    # Pre-rendered clouds at these scales; each cloud snaps its random scale to the nearest one
+    CLOUD_SCALES = (0.8, 1.0, 1.2, 1.4)
+    PAGODA_SPEED = 0.2
+    LANTERN_SPEED = 0.12
+    _cloud_surfs = None
+
     def __init__(self, assets):
         self.assets = assets
+        if Environment._cloud_surfs is None:
+            Environment._cloud_surfs = [self._render_cloud(sc) for sc in self.CLOUD_SCALES]
         self.cycle_timer = 0
         self.is_day = True
         self.current_sky = list(Config.COLORS['day_sky'])
+        self.sky_color = tuple(Config.COLORS['day_sky'])
+        # is_day -> [baked static background, sky colour it was drawn with]
+        self._bg = {True: [None, None], False: [None, None]}
         # Background images disabled for visibility
         self.bg_day = None
         self.bg_night = None
         # Blend factor for cross-fade: 1.0 = day, 0.0 = night
         self.bg_blend = 1.0
         
-        # Parallax Layers: [Image, x, y, speed_factor]
-        self.layers = []
+        # Parallax objects as parallel per-field lists (SoA); pagodas/lanterns share one image and speed
+        self.pagoda_img = assets['pagoda']
+        self.lantern_img = assets['lantern']
         # Add 3 Pagodas spaced out
-        for i in range(3):
-            self.layers.append({
-                'img': assets['pagoda'],
-                'x': i * 400 + 100,
-                'y': Config.GROUND_Y - 140,
-                'speed': 0.2
-            })
-        self.clouds = []
-        self.lanterns = []
+        self.pagoda_x = [i * 400 + 100 for i in range(3)]
+        self.pagoda_y = Config.GROUND_Y - 140
+        self.cloud_x, self.cloud_y, self.cloud_speed, self.cloud_surf = [], [], [], []
         for i in range(4):
-            self.clouds.append({'x': random.randint(0, Config.SCREEN_WIDTH), 'y': random.randint(20, 160), 'speed': 0.1 + random.random() * 0.15, 'scale': random.uniform(0.8, 1.4)})
+            self.cloud_x.append(random.randint(0, Config.SCREEN_WIDTH))
+            self.cloud_y.append(random.randint(20, 160))
+            self.cloud_speed.append(0.1 + random.random() * 0.15)
+            self.cloud_surf.append(self._cloud_surf(random.uniform(0.8, 1.4)))
+        self.lantern_x, self.lantern_y = [], []
         for i in range(3):
-            self.lanterns.append({'x': random.randint(0, Config.SCREEN_WIDTH), 'y': random.randint(120, 220), 'speed': 0.12, 'img': assets['lantern']})
+            self.lantern_x.append(random.randint(0, Config.SCREEN_WIDTH))
+            self.lantern_y.append(random.randint(120, 220))
+
+    @staticmethod
+    def _render_cloud(scale):
+        w = int(80 * scale)
+        h = int(40 * scale)
+        s = pygame.Surface((w, h), pygame.SRCALPHA)
+        col = (255, 255, 255, 200)
+        pygame.draw.ellipse(s, col, (0, 10, w-10, h-10))
+        pygame.draw.ellipse(s, col, (10, 0, w-20, h-20))
+        return _display_format(s)
+
+    def _cloud_surf(self, scale):
+        idx = min(len(self.CLOUD_SCALES) - 1, max(0, round((scale - self.CLOUD_SCALES[0]) / 0.2)))
+        return self._cloud_surfs[idx]
 
     def toggle_day_night(self):
         # Immediate toggle when user requests
@@ -980,10 +1579,9 @@ class Environment:
         self.cycle_timer += 1
         target = Config.COLORS['day_sky'] if self.is_day else Config.COLORS['night_sky']
         
-        # Smoothly transition RGB values
-        for i in range(3):
-            if self.current_sky[i] < target[i]: self.current_sky[i] += 0.2
-            elif self.current_sky[i] > target[i]: self.current_sky[i] -= 0.2
+        # Smoothly transition RGB values: step at most 0.2 per channel, landing exactly on target
+        self.current_sky = [c + max(-0.2, min(0.2, t - c)) for c, t in zip(self.current_sky, target)]
+        self.sky_color = (int(self.current_sky[0]), int(self.current_sky[1]), int(self.current_sky[2]))
             
         # Smoothly transition background blend
         target_blend = 1.0 if self.is_day else 0.0
@@ -995,57 +1593,107 @@ class Environment:
             self.cycle_timer = 0
 
         # 2. Update Parallax
-        for layer in self.layers:
-            layer['x'] -= speed * layer['speed']
-            if layer['x'] < -200:
-                layer['x'] = Config.SCREEN_WIDTH + random.randint(50, 300)
-        for c in self.clouds:
-            c['x'] -= speed * c['speed']
-            if c['x'] < -120:
-                c['x'] = Config.SCREEN_WIDTH + random.randint(0, 200)
-                c['y'] = random.randint(30, 160)
-                c['scale'] = random.uniform(0.8, 1.4)
-        for l in self.lanterns:
-            l['x'] -= speed * l['speed']
-            if l['x'] < -50:
-                l['x'] = Config.SCREEN_WIDTH + random.randint(50, 300)
+        randint = random.randint
+        width = Config.SCREEN_WIDTH
+        xs = self.pagoda_x
+        dx = speed * self.PAGODA_SPEED
+        for i in range(len(xs)):
+            xs[i] -= dx
+            if xs[i] < -200:
+                xs[i] = width + randint(50, 300)
+        xs = self.cloud_x
+        cloud_speed = self.cloud_speed
+        for i in range(len(xs)):
+            xs[i] -= speed * cloud_speed[i]
+            if xs[i] < -120:
+                xs[i] = width + randint(0, 200)
+                self.cloud_y[i] = randint(30, 160)
+                self.cloud_surf[i] = self._cloud_surf(random.uniform(0.8, 1.4))
+        xs = self.lantern_x
+        dx = speed * self.LANTERN_SPEED
+        for i in range(len(xs)):
+            xs[i] -= dx
+            if xs[i] < -50:
+                xs[i] = width + randint(50, 300)
+
+    def _background(self):
+        # Static layer (sky, sun/moon, ground) per day/night mode; redrawn only when the
+        # integer sky colour it was baked with changes, i.e. during a fade
+        baked = self._bg[self.is_day]
+        if baked[1] != self.sky_color:
+            bg = baked[0]
+            if bg is None:
+                bg = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+                if pygame.display.get_surface() is not None:
+                    bg = bg.convert()
+                baked[0] = bg
+            # Always use color sky for maximum visibility
+            bg.fill(self.sky_color)
+            # Sun / Moon
+            cx, cy = 800, 100
+            if self.is_day:
+                pygame.draw.circle(bg, (255, 255, 200), (cx, cy), 40) # Sun
+            else:
+                pygame.draw.circle(bg, (220, 220, 220), (cx, cy), 30) # Moon
+                pygame.draw.circle(bg, self.sky_color, (cx - 10, cy - 5), 25) # Crescent cutout
+            # Ground
+            pygame.draw.rect(bg, Config.COLORS['ground'],
+                             (0, Config.GROUND_Y, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT - Config.GROUND_Y))
+            pygame.draw.line(bg, Config.COLORS['grass'],
+                             (0, Config.GROUND_Y), (Config.SCREEN_WIDTH, Config.GROUND_Y), 4)
+            baked[1] = self.sky_color
+        return baked[0]
 
     def draw(self, surf):
-        # Always use color sky for maximum visibility
-        surf.fill(tuple(int(c) for c in self.current_sky))
-        
-        # Sun / Moon
-        cx, cy = 800, 100
-        if self.is_day:
-            pygame.draw.circle(surf, (255, 255, 200), (cx, cy), 40) # Sun
-        else:
-            pygame.draw.circle(surf, (220, 220, 220), (cx, cy), 30) # Moon
-            pygame.draw.circle(surf, tuple(map(int, self.current_sky)), (cx - 10, cy - 5), 25) # Crescent cutout
+        # Sky, sun/moon and ground all sit below every parallax layer: one blit
+        surf.blit(self._background(), (0, 0))
 
         # Parallax Objects
-        for layer in self.layers:
-            surf.blit(layer['img'], (layer['x'], layer['y']))
-        for c in self.clouds:
-            w = int(80 * c['scale'])
-            h = int(40 * c['scale'])
-            s = pygame.Surface((w, h), pygame.SRCALPHA)
-            col = (255, 255, 255, 200)
-            pygame.draw.ellipse(s, col, (0, 10, w-10, h-10))
-            pygame.draw.ellipse(s, col, (10, 0, w-20, h-20))
-            surf.blit(s, (int(c['x']), int(c['y'])))
-        for l in self.lanterns:
-            surf.blit(l['img'], (int(l['x']), int(l['y'])))
-
-        # Ground
-        pygame.draw.rect(surf, Config.COLORS['ground'], 
-                         (0, Config.GROUND_Y, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT - Config.GROUND_Y))
-        pygame.draw.line(surf, Config.COLORS['grass'], 
-                         (0, Config.GROUND_Y), (Config.SCREEN_WIDTH, Config.GROUND_Y), 4)
+        blit = surf.blit
+        img, y = self.pagoda_img, self.pagoda_y
+        for x in self.pagoda_x:
+            blit(img, (x, y))
+        for img, x, y in zip(self.cloud_surf, self.cloud_x, self.cloud_y):
+            blit(img, (int(x), int(y)))
+        img = self.lantern_img
+        for x, y in zip(self.lantern_x, self.lantern_y):
+            blit(img, (int(x), int(y)))
 
 # ==============================================================================
 # 7. GAME ENGINE (Main Class)
 # ==============================================================================
+def _load_font(filename, sys_name, size, bold=False):
+    # A bundled TTF opens directly; SysFont has to enumerate the system font directories first
+    path = os.path.join(Config.FONT_DIR, filename)
+    if os.path.isfile(path):
+        try:
+            return pygame.font.Font(path, size)
+        except Exception:
+            pass
+    return pygame.font.SysFont(sys_name, size, bold=bold)
+
+@functools.lru_cache(maxsize=128)
+def _render_text(font, text, color):
+    # HUD/menu strings repeat frame after frame; rasterize each (font, text, colour) once
+    return font.render(text, True, color)
+
+def _update_compact(items, speed, min_x):
+    # Advance every item and drop those scrolled past min_x in one in-place pass (no new list)
+    w = 0
+    for item in items:
+        item.update(speed)
+        if item.rect.x > min_x:
+            items[w] = item
+            w += 1
+    del items[w:]
+
 class Game:
+    # Default obstacle mix: cumulative upper bounds of random() -> kind, sampled with bisect
+    SPAWN_CUMW = (0.25, 0.45, 0.65, 0.9)
+    SPAWN_KINDS = ('rock', 'barrel', 'bamboo', 'dragon', 'boulder')
+    # Dragon colours weighted 5:4:1, indexed by int(random() * 10)
+    DRAGON_COLORS = ('red',) * 5 + ('green',) * 4 + ('black',)
+
     def __init__(self):
         pygame.init()
         self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
@@ -1058,14 +1706,29 @@ class Game:
         self.assets.load_all()
         
         # Fonts
-        self.font_main = pygame.font.SysFont("Impact", 40)
-        self.font_small = pygame.font.SysFont("Arial", 20, bold=True)
+        self.font_main = _load_font('impact.ttf', "Impact", 40)
+        self.font_small = _load_font('dejavusans-bold.ttf', "Arial", 20, bold=True)
         
         self.high_score = self.load_high_score()
+        # Highest score known to be on disk; guarded by _score_lock for the writer threads
+        self._saved_high_score = self.high_score
+        self._score_lock = threading.Lock()
         self.reset_game()
         self.state = "MENU" # MENU, PLAYING, GAMEOVER
         # UI: day/night toggle button
         self.toggle_rect = pygame.Rect(Config.SCREEN_WIDTH - 210, 10, 200, 28)
+        # Full-screen tints for the menu / game-over screens, built once
+        self._menu_overlay = self._make_overlay((0, 0, 0), 150)
+        self._gameover_overlay = self._make_overlay((50, 0, 0), 180) # Red tint
+        # Outside PLAYING the frame only changes on input, so draw() runs on demand
+        self._needs_redraw = True
+
+    @staticmethod
+    def _make_overlay(color, alpha):
+        overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+        overlay.fill(color)
+        overlay.set_alpha(alpha)
+        return overlay
 
     def load_high_score(self):
         try:
@@ -1075,18 +1738,34 @@ class Game:
             return 0
 
     def save_high_score(self):
+        # Called on the GAMEOVER frame: update memory now, write the file off the render thread
         if int(self.score) > self.high_score:
             self.high_score = int(self.score)
-            with open("highscore.txt", "w") as f:
-                f.write(str(self.high_score))
+            threading.Thread(target=self.flush_high_score, name="highscore-writer").start()
+
+    def flush_high_score(self):
+        # Writes only if a higher score than the one on disk is pending, so racing writers can't regress it
+        with self._score_lock:
+            value = self.high_score
+            if value <= self._saved_high_score:
+                return
+            try:
+                with open("highscore.txt", "w") as f:
+                    f.write(str(value))
+                self._saved_high_score = value
+            except OSError:
+                pass
 
     def reset_game(self):
         self.samurai = Samurai(self.assets.sprites)
         self.env = Environment(self.assets.sprites)
         self.obstacles = []
         self.powerups = []
-        self.particles = []
+        self.obstacle_index = SpatialIndex()
+        self.powerup_index = SpatialIndex()
+        self.particles = ParticlePool()
         self.score = 0
+        self._next_score_sound = 100
         self.speed = Config.START_SPEED
         self.game_over_timer = 0
         self.frame_count = 0
@@ -1099,10 +1778,11 @@ class Game:
 
     def spawn_logic(self):
         # Obstacles
-        if not self.obstacles or self.obstacles[-1].x < Config.SCREEN_WIDTH - random.randint(400, 800):
+        # Checked every frame: a random() draw is several times cheaper than randint()
+        if not self.obstacles or self.obstacles[-1].rect.x < Config.SCREEN_WIDTH - 400 - int(random.random() * 401):
             # Global minimum gap from the last obstacle on screen
             min_gap_px = 140
-            last_x = self.obstacles[-1].x if self.obstacles else -9999
+            last_x = self.obstacles[-1].rect.x if self.obstacles else -9999
             spawn_x = max(Config.SCREEN_WIDTH, last_x + min_gap_px)
             # Ensure an early first dragon if user provided one
             if (not self.first_dragon_spawned) and self.frame_count >= 60:
@@ -1125,10 +1805,8 @@ class Game:
                             self.obstacles.append(Obstacle(spawn_x, 'folder_dragon', self.assets.sprites, data))
                             self.last_spawn_type = 'folder_dragon'
                             self.first_dragon_spawned = True
-                            try:
+                            if Config.DEBUG_SPAWN:
                                 print("Spawned dragon from strict images pool")
-                            except Exception:
-                                pass
                         else:
                             data = random.choice(gpool)
                             self.obstacles.append(Obstacle(spawn_x, 'folder', self.assets.sprites, data))
@@ -1138,10 +1816,8 @@ class Game:
                         self.obstacles.append(Obstacle(spawn_x, 'folder_dragon', self.assets.sprites, data))
                         self.last_spawn_type = 'folder_dragon'
                         self.first_dragon_spawned = True
-                        try:
+                        if Config.DEBUG_SPAWN:
                             print("Spawned dragon from strict images pool")
-                        except Exception:
-                            pass
                     else:
                         data = random.choice(gpool)
                         self.obstacles.append(Obstacle(spawn_x, 'folder', self.assets.sprites, data))
@@ -1163,16 +1839,11 @@ class Game:
                     self.last_spawn_type = 'folder_dragon'
             else:
                 # Default weighted mix
-                r = random.random()
-                if r < 0.25:
-                    type_ = 'rock'
-                    self.obstacles.append(Obstacle(spawn_x, type_, self.assets.sprites))
-                    self.last_spawn_type = 'rock'
-                elif r < 0.45:
-                    type_ = 'barrel'
-                    self.obstacles.append(Obstacle(spawn_x, type_, self.assets.sprites))
-                    self.last_spawn_type = 'barrel'
-                elif r < 0.65 and self.last_spawn_type != 'bamboo':
+                kind = self.SPAWN_KINDS[bisect.bisect_right(self.SPAWN_CUMW, random.random())]
+                if kind == 'bamboo' and self.last_spawn_type == 'bamboo':
+                    # Never two bamboo in a row; that slice of the roll goes to dragons
+                    kind = 'dragon'
+                if kind == 'bamboo':
                     # Bamboo cooldowns
                     bamboo_frame_cooldown = 240
                     bamboo_px_cooldown = 300
@@ -1186,19 +1857,17 @@ class Game:
                     else:
                         self.obstacles.append(Obstacle(spawn_x, 'rock', self.assets.sprites))
                         self.last_spawn_type = 'rock'
-                elif r < 0.9:
+                elif kind == 'dragon':
                     h = random.choice(['low', 'mid', 'high'])
-                    color = random.choices(['red', 'green', 'black'], weights=[5, 4, 1])[0]
+                    color = self.DRAGON_COLORS[int(random.random() * 10)]
                     type_ = f'dragon_{h}_{color}'
                     self.obstacles.append(Obstacle(spawn_x, type_, self.assets.sprites))
                     self.last_spawn_type = 'dragon'
                 else:
-                    if self.assets.sprites.get('boulder_image_available', False):
-                        type_ = 'boulder'
-                    else:
-                        type_ = 'rock'
-                    self.obstacles.append(Obstacle(spawn_x, type_, self.assets.sprites))
-                    self.last_spawn_type = type_
+                    if kind == 'boulder' and not self.assets.sprites.get('boulder_image_available', False):
+                        kind = 'rock'
+                    self.obstacles.append(Obstacle(spawn_x, kind, self.assets.sprites))
+                    self.last_spawn_type = kind
 
         # Powerups (Rare)
         if random.random() < 0.003:
@@ -1206,15 +1875,17 @@ class Game:
 
         # Ambient Particles
         if self.env.is_day and random.random() < 0.1:
-            self.particles.append(Particle(random.randint(0, Config.SCREEN_WIDTH), -10, 'petal'))
+            self.particles.emit(int(random.random() * (Config.SCREEN_WIDTH + 1)), -10, 'petal')
         elif not self.env.is_day and random.random() < 0.05:
-            self.particles.append(Particle(random.randint(0, Config.SCREEN_WIDTH), Config.SCREEN_HEIGHT, 'sparkle'))
+            self.particles.emit(int(random.random() * (Config.SCREEN_WIDTH + 1)), Config.SCREEN_HEIGHT, 'sparkle')
 
     def update(self):
         # 1. Update Score & Speed
         self.score += Config.SCORE_PER_FRAME
-        if int(self.score) % 100 == 0 and int(self.score) > 0:
+        if self.score >= self._next_score_sound:
             self.audio.play('score')
+            # Next hundred above the current score, so +50 bonuses never queue up chimes
+            self._next_score_sound = (int(self.score) // 100 + 1) * 100
         
         self.speed = min(Config.MAX_SPEED, self.speed + Config.SPEED_INCREMENT)
         # Effective speed (dash boost ~25%)
@@ -1225,69 +1896,70 @@ class Game:
         self.env.update(eff_speed)
         self.samurai.update()
         if not self.samurai.is_jumping and not self.samurai.is_ducking and self.frame_count % 12 == 0:
-            self.particles.append(Particle(self.samurai.x, self.samurai.y + 80, 'dust'))
+            self.particles.emit(self.samurai.x, self.samurai.y + 80, 'dust')
         
         self.spawn_logic()
 
         # 3. Update Lists
-        for p in self.particles: p.update()
-        self.particles = [p for p in self.particles if p.life > 0]
+        self.particles.update()
 
-        for p in self.powerups: p.update(eff_speed)
-        # Cleanup Powerups
-        self.powerups = [p for p in self.powerups if p.x > -100]
+        # Update + cleanup Powerups and Obstacles
+        _update_compact(self.powerups, eff_speed, -100)
+        _update_compact(self.obstacles, eff_speed, -200)
 
-        for obs in self.obstacles:
-            obs.update(eff_speed)
-        # Cleanup Obstacles
-        self.obstacles = [o for o in self.obstacles if o.x > -200]
+        self.powerup_index.sync(self.powerups)
+        self.obstacle_index.sync(self.obstacles)
 
         # 3.5 Tornado auto-destroys next obstacle ahead (single-use)
         if self.samurai.tornado_ready and self.obstacles:
-            ahead = [o for o in self.obstacles if o.x > self.samurai.x + 20]
-            if ahead:
-                target = ahead[0]
+            target = self.obstacle_index.first_right_of(self.samurai.x + 20)
+            if target is not None:
                 self.obstacles.remove(target)
+                self.obstacle_index.discard(target)
                 self.audio.play('slash')
                 self.score += 50
                 for _ in range(8):
-                    self.particles.append(Particle(target.x, target.rect.y, 'debris'))
+                    self.particles.emit(target.rect.x, target.rect.y, 'debris')
                 self.samurai.tornado_ready = False
 
-        # 4. Collision Detection
+        # 4. Collision Detection (only against things bucketed near the player)
         player_rect = self.samurai.get_hitbox()
 
         # Powerup Collision
-        for p in self.powerups[:]:
+        for p in self.powerup_index.query(player_rect):
             if player_rect.colliderect(p.rect):
                 self.samurai.activate_powerup(p.type, self.audio)
                 self.powerups.remove(p)
+                self.powerup_index.discard(p)
                 # Burst effect
                 for _ in range(10):
-                    self.particles.append(Particle(self.samurai.x, self.samurai.y, 'sparkle'))
+                    self.particles.emit(self.samurai.x, self.samurai.y, 'sparkle')
 
-        # Obstacle Collision (pixel-perfect)
-        sam_surf, sam_rect = self.samurai.get_surface_and_rect()
-        sam_mask = pygame.mask.from_surface(sam_surf)
-        for obs in self.obstacles[:]:
+        # Obstacle Collision (player hitbox vs per-type obstacle hitbox, or masks if PIXEL_PERFECT)
+        if Config.PIXEL_PERFECT:
+            sam_rect = self.samurai.get_surface_and_rect()[1]
+            probe = sam_rect
+        else:
+            probe = player_rect
+        for obs in self.obstacle_index.query(probe):
             if obs.rect.right <= 0 or obs.rect.left >= Config.SCREEN_WIDTH:
                 continue
-            if not sam_rect.colliderect(obs.rect):
-                continue
-            offset = (obs.rect.x - sam_rect.x, obs.rect.y - sam_rect.y)
-            if getattr(obs, 'mask', None) is None:
-                obs.scaled_img = pygame.transform.smoothscale(obs.img, (obs.rect.w, obs.rect.h))
-                obs.mask = pygame.mask.from_surface(obs.scaled_img)
-            if sam_mask.overlap(obs.mask, offset):
+            if Config.PIXEL_PERFECT:
+                hit = (sam_rect.colliderect(obs.rect) and
+                       self.samurai.get_mask().overlap(obs.get_mask(), (obs.rect.x - sam_rect.x, obs.rect.y - sam_rect.y)))
+            else:
+                hit = player_rect.colliderect(obs.get_hitbox())
+            if hit:
                 # Collision occurs: handle normally
                 # Tornado single-use if still ready on collision
                 if self.samurai.tornado_ready:
                     if obs in self.obstacles:
                         self.obstacles.remove(obs)
+                        self.obstacle_index.discard(obs)
                     self.audio.play('slash')
                     self.score += 50
                     for _ in range(8):
-                        self.particles.append(Particle(obs.x, obs.rect.y, 'debris'))
+                        self.particles.emit(obs.rect.x, obs.rect.y, 'debris')
                     self.samurai.tornado_ready = False
                 # Dash: invulnerable, pass through
                 elif self.samurai.dash_timer > 0:
@@ -1298,10 +1970,10 @@ class Game:
                     self.save_high_score()
 
     def draw_text_centered(self, text, font, y_offset, color=(255, 255, 255)):
-        s = font.render(text, True, color)
+        s = _render_text(font, text, color)
         rect = s.get_rect(center=(Config.SCREEN_WIDTH//2, Config.SCREEN_HEIGHT//2 + y_offset))
         # Shadow
-        s_shadow = font.render(text, True, (0,0,0))
+        s_shadow = _render_text(font, text, (0,0,0))
         self.screen.blit(s_shadow, (rect.x+2, rect.y+2))
         self.screen.blit(s, rect)
 
@@ -1310,15 +1982,14 @@ class Game:
         self.env.draw(self.screen)
         
         for p in self.powerups: p.draw(self.screen)
-        # Draw ground obstacles first, dragons later for top visibility
+        # Draw ground obstacles first, dragons later for top visibility;
+        # each layer goes out as a single batched blit
+        ground, dragons = [], []
         for obs in self.obstacles:
-            if 'dragon' not in obs.type:
-                obs.draw(self.screen)
-        for part in self.particles: part.draw(self.screen)
-        # Draw dragons on top
-        for obs in self.obstacles:
-            if 'dragon' in obs.type:
-                obs.draw(self.screen)
+            (dragons if obs.is_dragon else ground).extend(obs.blit_items())
+        self.screen.blits(ground, doreturn=False)
+        self.particles.draw(self.screen)
+        self.screen.blits(dragons, doreturn=False)
         
         self.samurai.draw(self.screen)
 
@@ -1328,20 +1999,11 @@ class Game:
             pygame.draw.rect(self.screen, (0,255,0), self.samurai.get_hitbox(), 2)
             # Obstacles
             for obs in self.obstacles:
-                # Per-type shrink preview (matches collision below)
-                if obs.type == 'bamboo':
-                    hb = obs.rect.inflate(-16, -10)
-                elif obs.type == 'boulder':
-                    hb = obs.rect.inflate(-12, -12)
-                elif 'dragon' in obs.type:
-                    hb = obs.rect.inflate(-18, -12)
-                else:
-                    hb = obs.rect.inflate(-18, -18)
-                pygame.draw.rect(self.screen, (255,0,0), hb, 2)
+                pygame.draw.rect(self.screen, (255,0,0), obs.get_hitbox(), 2)
 
         # Draw HUD
-        score_txt = self.font_small.render(f"SCORE: {int(self.score)}", True, Config.COLORS['text'])
-        high_txt = self.font_small.render(f"HI: {self.high_score}", True, (200, 200, 200))
+        score_txt = _render_text(self.font_small, f"SCORE: {int(self.score)}", Config.COLORS['text'])
+        high_txt = _render_text(self.font_small, f"HI: {self.high_score}", (200, 200, 200))
         self.screen.blit(score_txt, (20, 20))
         self.screen.blit(high_txt, (20, 50))
         
@@ -1349,36 +2011,30 @@ class Game:
         pygame.draw.rect(self.screen, (0,0,0), self.toggle_rect, border_radius=6)
         pygame.draw.rect(self.screen, (230,230,230), self.toggle_rect.inflate(-2, -2), border_radius=6)
         label = "Toggle Day/Night (T)"
-        txt = self.font_small.render(label, True, (20,20,20))
+        txt = _render_text(self.font_small, label, (20,20,20))
         tr = txt.get_rect(center=self.toggle_rect.center)
         self.screen.blit(txt, tr)
         
         # Status: Tornado ready indicator
         if self.samurai.tornado_ready:
-            self.screen.blit(self.font_small.render("TORNADO READY", True, (255,120,120)), (20, 80))
+            self.screen.blit(_render_text(self.font_small, "TORNADO READY", (255,120,120)), (20, 80))
         # Dash bar (remaining frames)
         if self.samurai.dash_timer > 0:
             bar_w = int(self.samurai.dash_timer * 1.2)
             pygame.draw.rect(self.screen, (100, 200, 255), (20, 100, bar_w, 10))
-            self.screen.blit(self.font_small.render("DASH", True, (100,200,255)), (25, 95))
+            self.screen.blit(_render_text(self.font_small, "DASH", (100,200,255)), (25, 95))
 
         # Menus
         if self.state == "MENU":
             # Darken bg
-            overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-            overlay.set_alpha(150)
-            overlay.fill((0,0,0))
-            self.screen.blit(overlay, (0,0))
+            self.screen.blit(self._menu_overlay, (0,0))
             
             self.draw_text_centered(Config.TITLE, self.font_main, -50, (255, 215, 0))
             self.draw_text_centered("Press SPACE to Start", self.font_small, 20)
             self.draw_text_centered("Arrows: Jump/Duck | Collect Items for Powerups", self.font_small, 60, (200,200,200))
 
         elif self.state == "GAMEOVER":
-            overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-            overlay.set_alpha(180)
-            overlay.fill((50,0,0)) # Red tint
-            self.screen.blit(overlay, (0,0))
+            self.screen.blit(self._gameover_overlay, (0,0))
             
             self.draw_text_centered("HONOR LOST", self.font_main, -40, (255, 50, 50))
             self.draw_text_centered(f"Final Score: {int(self.score)}", self.font_small, 10)
@@ -1390,7 +2046,10 @@ class Game:
         while True:
             # Events
             for event in pygame.event.get():
+                # Any input (or window expose) may change the menu/gameover frame
+                self._needs_redraw = True
                 if event.type == pygame.QUIT:
+                    self.flush_high_score()
                     pygame.quit()
                     sys.exit()
                 
@@ -1423,9 +2082,9 @@ class Game:
                         elif self.state == "PLAYING":
                             effect = self.samurai.jump(self.audio)
                             if effect == 'dust':
-                                for _ in range(3): self.particles.append(Particle(self.samurai.x, self.samurai.y+80, 'dust'))
+                                for _ in range(3): self.particles.emit(self.samurai.x, self.samurai.y+80, 'dust')
                             elif effect == 'sparkle':
-                                for _ in range(5): self.particles.append(Particle(self.samurai.x, self.samurai.y+40, 'sparkle'))
+                                for _ in range(5): self.particles.emit(self.samurai.x, self.samurai.y+40, 'sparkle')
                                 
                     if event.key == pygame.K_DOWN:
                         if self.state == "PLAYING":
@@ -1440,11 +2099,15 @@ class Game:
                         self.env.toggle_day_night()
 
             # Loop
-            if self.state == "PLAYING":
+            playing = self.state == "PLAYING"
+            if playing:
                 self.update()
             
-            self.draw()
-            self.clock.tick(Config.FPS)
+            # Also covers the PLAYING -> GAMEOVER frame, since update() ran this tick
+            if playing or self._needs_redraw:
+                self.draw()
+                self._needs_redraw = False
+            self.clock.tick(Config.FPS if self.state == "PLAYING" else Config.IDLE_FPS)
 
 if __name__ == '__main__':
     Game().run()